@@ -6,24 +6,57 @@ It includes parallel downloading, logging, and video creation capabilities.
 Now includes an option to exclude images taken between 8 PM and 6 AM and saves images in yyyymmdd format.
 """
 
+import asyncio
+import errno
+import functools
+import hashlib
+import json
+import logging
+import logging.handlers
 import os
+import pickle
+import shutil
+import subprocess
+import tarfile
+import tempfile
 from datetime import datetime
 import time
 from typing import List, Tuple
 import csv
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
+import aiofiles
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
-from concurrent.futures import ThreadPoolExecutor
 import cv2
+import numpy as np
 from dotenv import load_dotenv
 
+# Buffer download progress in memory and flush in batches; per-image prints
+# would serialize the downloads on the stdout lock
+logger = logging.getLogger(__name__)
+_progress_handler = logging.handlers.MemoryHandler(
+    capacity=1024, flushLevel=logging.ERROR, target=logging.StreamHandler()
+)
+logger.addHandler(_progress_handler)
+logger.setLevel(logging.INFO)
+
+# Emit one progress line per this many downloaded images
+PROGRESS_INTERVAL = 50
+
 
+@functools.lru_cache(maxsize=1 << 16)
 def get_image_timestamp(filename: str) -> datetime:
     """
     Extracts the timestamp from the image filename.
 
     Assumes that the filename includes the timestamp in the format 'YYYYMMDD_HHMMSS'.
+    Results are memoized since the same filenames are parsed again when
+    building the timelapse.
 
     Args:
         filename (str): The image filename.
@@ -33,6 +66,16 @@ def get_image_timestamp(filename: str) -> datetime:
     """
     base_name = os.path.basename(filename)
     name_part, _ = os.path.splitext(base_name)
+    # Fast path: slice the fixed-width fields directly instead of paying
+    # for strptime's format parsing on every call
+    if len(name_part) == 15 and name_part[8] == '_':
+        try:
+            return datetime(
+                int(name_part[0:4]), int(name_part[4:6]), int(name_part[6:8]),
+                int(name_part[9:11]), int(name_part[11:13]), int(name_part[13:15])
+            )
+        except ValueError:
+            pass
     try:
         dt = datetime.strptime(name_part, '%Y%m%d_%H%M%S')
         return dt
@@ -41,6 +84,127 @@ def get_image_timestamp(filename: str) -> datetime:
         return None
 
 
+def scan_files(path: str):
+    """
+    Recursively yield an os.DirEntry for every file under the given path.
+
+    Uses os.scandir, which reuses the readdir results for the type checks
+    instead of the extra stat calls and per-directory name lists os.walk pays.
+
+    Args:
+        path (str): Directory to scan.
+
+    Yields:
+        os.DirEntry: One entry per file found.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from scan_files(entry.path)
+            else:
+                yield entry
+
+
+def _encoder_works(encoder: str) -> bool:
+    """
+    Verify an encoder with a one-frame trial encode.
+
+    ffmpeg lists hardware encoders it was built with even on machines
+    without the matching GPU, where the actual encode fails at runtime.
+
+    Args:
+        encoder (str): Name of the ffmpeg encoder to test.
+
+    Returns:
+        bool: True if the trial encode succeeded.
+    """
+    try:
+        return subprocess.run(
+            ['ffmpeg', '-hide_banner', '-loglevel', 'error',
+             '-f', 'lavfi', '-i', 'color=black:s=64x64', '-frames:v', '1',
+             '-c:v', encoder, '-f', 'null', '-'],
+            capture_output=True
+        ).returncode == 0
+    except OSError:
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_video_encoder() -> str:
+    """
+    Pick the fastest available H.264 encoder.
+
+    Probes ffmpeg once for a working hardware encoder (NVENC, VideoToolbox
+    or Quick Sync) and falls back to software libx264.
+
+    Returns:
+        str: Name of the ffmpeg encoder to use.
+    """
+    try:
+        output = subprocess.run(
+            ['ffmpeg', '-hide_banner', '-encoders'],
+            capture_output=True, text=True
+        ).stdout
+    except OSError:
+        return 'libx264'
+    for encoder in ('h264_nvenc', 'h264_videotoolbox', 'h264_qsv'):
+        if encoder in output and _encoder_works(encoder):
+            return encoder
+    return 'libx264'
+
+
+def _is_timestamped_jpg(filename: str) -> bool:
+    """Check whether a filename looks like a YYYYMMDD_HHMMSS jpg."""
+    name = os.path.basename(filename)
+    return name.endswith('.jpg') and len(name) >= 15 and name[8] == '_'
+
+
+def _finalize_download(tmp_path: str, dst_path: str) -> None:
+    """
+    Move a completed download into place.
+
+    The staging file normally sits next to its destination, so the rename
+    is zero-copy. If it lives on a different filesystem (e.g. staged on
+    tmpfs), rename fails with EXDEV and the bytes are moved with
+    os.copy_file_range, keeping the copy inside the kernel.
+
+    Args:
+        tmp_path (str): Path of the fully written staging file.
+        dst_path (str): Final path for the image.
+    """
+    try:
+        os.replace(tmp_path, dst_path)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    if not hasattr(os, 'copy_file_range'):
+        shutil.move(tmp_path, dst_path)
+        return
+    try:
+        remaining = os.path.getsize(tmp_path)
+        src_fd = os.open(tmp_path, os.O_RDONLY)
+        try:
+            dst_fd = os.open(dst_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                while remaining > 0:
+                    copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+    except OSError:
+        # copy_file_range can itself refuse cross-device copies (EXDEV on
+        # kernels >= 5.19, ENOSYS/EINVAL elsewhere); fall back to a
+        # userspace move rather than stranding the finished download
+        shutil.move(tmp_path, dst_path)
+        return
+    os.remove(tmp_path)
+
+
 def is_time_in_exclude_window(hour: int, exclude_start: int, exclude_end: int) -> bool:
     """
     Determines if a given hour is within the exclude time window.
@@ -64,30 +228,138 @@ def is_time_in_exclude_window(hour: int, exclude_start: int, exclude_end: int) -
 class ImageDownloader:
     """Handles downloading images from a webpage."""
 
-    def __init__(self, save_dir: str, max_workers: int = 10, exclude_night_photos: bool = False):
+    def __init__(self, save_dir: str, max_workers: int = 10,
+                 exclude_night_photos: bool = False, archive_downloads: bool = False):
         """
         Initialize the ImageDownloader.
 
         Args:
             save_dir (str): Directory to save downloaded images
-            max_workers (int): Maximum number of concurrent download threads
+            max_workers (int): Maximum number of concurrent download connections
             exclude_night_photos (bool): Whether to exclude images taken between 8 PM and 6 AM
+            archive_downloads (bool): Whether to append images to one tar per
+                month instead of one file per image, avoiding per-file
+                metadata overhead on very large archives
         """
         self.save_dir = save_dir
         self.max_workers = max_workers
         self.exclude_night_photos = exclude_night_photos
+        self.archive_downloads = archive_downloads
+        self.session = self._create_session()
         self._ensure_save_dir()
+        self._manifest_path = os.path.join(save_dir, '.manifest.pkl')
+        self._manifest = None
+        self._scrape_meta_path = os.path.join(save_dir, '.scrape_meta.json')
+        self._done = 0
+        self._total = 0
+
+    def _create_session(self) -> requests.Session:
+        """Create a Session with a connection pool sized for the worker count."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.max_workers,
+            pool_maxsize=self.max_workers,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
 
     def _ensure_save_dir(self) -> None:
         """Create the save directory if it doesn't exist."""
         if not os.path.exists(self.save_dir):
             os.makedirs(self.save_dir)
 
-    def _download_single_image(self, img_info: Tuple[str, datetime]) -> bool:
+    def _load_manifest(self) -> set:
+        """
+        Load the set of already-downloaded filenames.
+
+        Reads the cached manifest if it is at least as new as the save
+        directory; otherwise rebuilds it by walking the tree.
+
+        Returns:
+            set: Filenames of images already on disk
+        """
+        try:
+            if os.path.getmtime(self._manifest_path) >= os.path.getmtime(self.save_dir):
+                with open(self._manifest_path, 'rb') as manifest_file:
+                    return pickle.load(manifest_file)
+        except (OSError, pickle.PickleError, EOFError):
+            pass
+
+        # Manifest is missing or stale; rebuild it from the directory tree,
+        # including the contents of any monthly tar archives. The per-date
+        # subdirectories are scanned in parallel, which hides per-directory
+        # latency on slow filesystems like NFS
+        manifest = set()
+        date_dirs = []
+        with os.scandir(self.save_dir) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    date_dirs.append(entry.path)
+                elif entry.name.endswith('.tar'):
+                    manifest.update(self._list_archive(entry.path))
+                else:
+                    manifest.add(entry.name)
+        if date_dirs:
+            with ThreadPoolExecutor(max_workers=min(16, len(date_dirs))) as executor:
+                for names in executor.map(self._scan_date_dir, date_dirs):
+                    manifest.update(names)
+        manifest.discard(os.path.basename(self._manifest_path))
+        return manifest
+
+    @staticmethod
+    def _scan_date_dir(path: str) -> List[str]:
+        """Collect the filenames under one date directory."""
+        return [entry.name for entry in scan_files(path)]
+
+    @staticmethod
+    def _list_archive(tar_path: str) -> List[str]:
+        """List the image basenames stored in one monthly tar archive."""
+        try:
+            with tarfile.open(tar_path) as tar:
+                return [os.path.basename(name) for name in tar.getnames()]
+        except tarfile.TarError as e:
+            print(f"Skipping unreadable archive {tar_path}: {e}")
+            return []
+
+    def _save_manifest(self) -> None:
+        """Atomically persist the manifest next to the images."""
+        tmp_path = self._manifest_path + '.tmp'
+        with open(tmp_path, 'wb') as manifest_file:
+            pickle.dump(self._manifest, manifest_file)
+        os.replace(tmp_path, self._manifest_path)
+
+    def _load_scrape_meta(self) -> dict:
+        """Load the cache validators saved from the previous page scrape."""
+        try:
+            with open(self._scrape_meta_path) as meta_file:
+                return json.load(meta_file)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _save_scrape_meta(self, response: requests.Response) -> None:
+        """Persist the page's cache validators for the next run."""
+        meta = {}
+        if response.headers.get('ETag'):
+            meta['etag'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            meta['last_modified'] = response.headers['Last-Modified']
+        tmp_path = self._scrape_meta_path + '.tmp'
+        with open(tmp_path, 'w') as meta_file:
+            json.dump(meta, meta_file)
+        os.replace(tmp_path, self._scrape_meta_path)
+
+    async def _download_single_image(
+        self, session: aiohttp.ClientSession, tar_lock: asyncio.Lock,
+        img_info: Tuple[str, datetime]
+    ) -> bool:
         """
         Download a single image.
 
         Args:
+            session (aiohttp.ClientSession): Shared HTTP session
+            tar_lock (asyncio.Lock): Serializes appends to the monthly tars
             img_info (tuple): Tuple containing (img_url, img_datetime)
 
         Returns:
@@ -95,24 +367,69 @@ class ImageDownloader:
         """
         img_url, img_datetime = img_info
         try:
-            img_data = requests.get(img_url).content
-            # Create subdirectory based on date
             date_str = img_datetime.strftime('%Y%m%d')
-            date_dir = os.path.join(self.save_dir, date_str)
-            if not os.path.exists(date_dir):
-                os.makedirs(date_dir)
-            # Save image in date directory with timestamped filename
-            img_filename = os.path.join(
-                date_dir, img_datetime.strftime('%Y%m%d_%H%M%S') + '.jpg'
-            )
-            with open(img_filename, 'wb') as img_file:
-                img_file.write(img_data)
-            print(f"Downloaded {img_filename}")
+            base_name = img_datetime.strftime('%Y%m%d_%H%M%S') + '.jpg'
+            if self.archive_downloads:
+                # All images of a month share one tar archive
+                img_filename = os.path.join(self.save_dir, date_str[:6] + '.tar')
+                tmp_filename = os.path.join(self.save_dir, base_name + '.part')
+            else:
+                # Create subdirectory based on date
+                date_dir = os.path.join(self.save_dir, date_str)
+                if not os.path.exists(date_dir):
+                    os.makedirs(date_dir)
+                # Save image in date directory with timestamped filename
+                img_filename = os.path.join(date_dir, base_name)
+                tmp_filename = img_filename + '.part'
+            # Stream the body straight to a temp file in fixed-size chunks,
+            # then finalize so a partial download never looks complete. The
+            # 1 MiB buffer coalesces the chunks into few large writes.
+            async with session.get(img_url) as response:
+                response.raise_for_status()
+                async with aiofiles.open(tmp_filename, 'wb', buffering=1 << 20) as img_file:
+                    async for chunk in response.content.iter_chunked(1 << 16):
+                        await img_file.write(chunk)
+            if self.archive_downloads:
+                async with tar_lock:
+                    with tarfile.open(img_filename, 'a') as tar:
+                        tar.add(tmp_filename, arcname=f"{date_str}/{base_name}")
+                os.remove(tmp_filename)
+            else:
+                _finalize_download(tmp_filename, img_filename)
+            self._manifest.add(base_name)
+            self._done += 1
+            if self._done % PROGRESS_INTERVAL == 0:
+                logger.info("Downloaded %d/%d images", self._done, self._total)
             return True
         except Exception as e:
-            print(f"Failed to download {img_url}: {e}")
+            logger.error("Failed to download %s: %s", img_url, e)
             return False
 
+    async def _download_all(self, image_info_list: List[Tuple[str, datetime]]) -> List[bool]:
+        """
+        Download all images concurrently on a single event loop.
+
+        Args:
+            image_info_list (list): List of (img_url, img_datetime) tuples
+
+        Returns:
+            list: Per-image success flags
+        """
+        connector = aiohttp.TCPConnector(
+            limit=self.max_workers,
+            limit_per_host=self.max_workers,
+            ttl_dns_cache=300
+        )
+        timeout = aiohttp.ClientTimeout(total=60, connect=5)
+        # Created here so the lock belongs to this run's event loop; each
+        # download_images call runs its own asyncio.run()
+        tar_lock = asyncio.Lock()
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            return await asyncio.gather(
+                *(self._download_single_image(session, tar_lock, img_info)
+                  for img_info in image_info_list)
+            )
+
     def download_images(self, url: str) -> int:
         """
         Download images from the specified URL.
@@ -124,14 +441,27 @@ class ImageDownloader:
             int: Number of new images downloaded
         """
         # Get existing images
-        downloaded_images = set()
-        for root, _, files in os.walk(self.save_dir):
-            downloaded_images.update(files)
-
-        # Scrape webpage for image links
-        response = requests.get(url)
-        soup = BeautifulSoup(response.text, 'html.parser')
-        image_links = soup.find_all('a', href=lambda href: href and href.endswith('.jpg'))
+        self._manifest = self._load_manifest()
+        downloaded_images = self._manifest
+
+        # Scrape webpage for image links, sending the validators from the
+        # previous run so an unchanged page costs a bodyless 304
+        headers = {}
+        scrape_meta = self._load_scrape_meta()
+        if 'etag' in scrape_meta:
+            headers['If-None-Match'] = scrape_meta['etag']
+        if 'last_modified' in scrape_meta:
+            headers['If-Modified-Since'] = scrape_meta['last_modified']
+        response = self.session.get(url, headers=headers, timeout=(5, 30))
+        if response.status_code == 304:
+            print("Page unchanged since last run; no new images.")
+            # Persist the manifest even on the early return, so a cold
+            # rebuild is not repeated on every poll of an unchanged page
+            self._save_manifest()
+            return 0
+        self._save_scrape_meta(response)
+        soup = BeautifulSoup(response.content, 'lxml')
+        image_links = soup.select('a[href$=".jpg"]')
 
         # Prepare list of images to download
         image_info_list = []
@@ -141,6 +471,16 @@ class ImageDownloader:
             if img_filename in downloaded_images:
                 continue
 
+            # Cheap night filter: for the usual YYYYMMDD_HHMMSS names the
+            # hour is two fixed digits, so reject night images before
+            # paying for the full timestamp parse
+            if (self.exclude_night_photos and len(img_filename) >= 11
+                    and img_filename[8] == '_'):
+                img_hour = (ord(img_filename[9]) - 48) * 10 + (ord(img_filename[10]) - 48)
+                if 0 <= img_hour <= 23 and is_time_in_exclude_window(img_hour, 20, 6):
+                    print(f"Excluding image taken at {img_hour}:00: {img_filename}")
+                    continue
+
             img_datetime = get_image_timestamp(img_filename)
             if img_datetime is None:
                 # Could not parse timestamp, skip the image
@@ -158,11 +498,15 @@ class ImageDownloader:
 
         if not image_info_list:
             print("No new images to download.")
+            self._save_manifest()
             return 0
 
         # Download images in parallel
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            results = list(executor.map(self._download_single_image, image_info_list))
+        self._done = 0
+        self._total = len(image_info_list)
+        results = asyncio.run(self._download_all(image_info_list))
+        _progress_handler.flush()
+        self._save_manifest()
 
         successful_downloads = sum(results)
         print(f"Downloaded {successful_downloads} new images.")
@@ -183,6 +527,42 @@ class TimelapseCreator:
         self.image_folder = image_folder
         self.fps = fps
 
+    @staticmethod
+    def _decode_frame(image_path: str):
+        """
+        Read raw JPEG bytes and decode them with cv2.imdecode.
+
+        Unlike imread's internal fopen/fread, the bytes land in one NumPy
+        array and decode reuses OpenCV's buffer pools, which keeps the
+        allocator steady when called in a tight prefetch loop.
+
+        Args:
+            image_path (str): Path of the JPEG to decode.
+
+        Returns:
+            numpy.ndarray: The decoded BGR frame, or None on failure.
+        """
+        try:
+            data = np.fromfile(image_path, np.uint8)
+        except OSError:
+            # Missing or unreadable file; treated like a failed decode,
+            # matching imread's behavior of returning None
+            return None
+        if data.size == 0:
+            return None
+        return cv2.imdecode(data, cv2.IMREAD_COLOR)
+
+    @staticmethod
+    def _write_frame(video: cv2.VideoWriter, image_path: str,
+                     repeat_count: int, future) -> None:
+        """Write one decoded frame, repeated for the length of its run."""
+        frame = future.result()
+        if frame is None:
+            print(f"Failed to read image: {image_path}")
+            return
+        for _ in range(repeat_count):
+            video.write(frame)
+
     def create_video(self, output_path: str) -> bool:
         """
         Create a timelapse video from the images.
@@ -194,26 +574,163 @@ class TimelapseCreator:
             bool: True if video creation was successful, False otherwise
         """
         image_files = []
-        for root, _, files in os.walk(self.image_folder):
-            for img in files:
-                if img.endswith('.jpg'):
-                    img_path = os.path.join(root, img)
-                    img_timestamp = get_image_timestamp(img)
-                    if img_timestamp:
-                        image_files.append((img_timestamp, img_path))
-                    else:
-                        # Skip images without recognizable timestamp
+        tar_paths = []
+        for entry in scan_files(self.image_folder):
+            # The fixed-width timestamped names order correctly as plain
+            # strings, so no datetimes are needed for sorting
+            if _is_timestamped_jpg(entry.name):
+                image_files.append(entry.path)
+            elif entry.name.endswith('.tar'):
+                tar_paths.append(entry.path)
+
+        # Monthly archives are unpacked into a scratch directory for the
+        # duration of the encode; reading a tar is one sequential pass
+        temp_dir = tempfile.TemporaryDirectory() if tar_paths else None
+        try:
+            for tar_path in tar_paths:
+                image_files.extend(self._extract_archive(tar_path, temp_dir.name))
+
+            if not image_files:
+                print("No images found for timelapse creation.")
+                return False
+
+            # Sort images by timestamp; keyed on the basename so loose and
+            # archive-extracted files interleave correctly
+            image_files.sort(key=os.path.basename)
+            frames = self._coalesce_duplicate_frames(image_files)
+
+            # Prefer ffmpeg, which consumes the JPEGs directly; fall back to
+            # OpenCV when it is not installed
+            if shutil.which('ffmpeg'):
+                return self._create_video_ffmpeg(frames, output_path)
+            return self._create_video_opencv(frames, output_path)
+        finally:
+            if temp_dir is not None:
+                temp_dir.cleanup()
+
+    @staticmethod
+    def _coalesce_duplicate_frames(image_files: List[str]) -> List[Tuple[str, int]]:
+        """
+        Collapse runs of consecutive identical frames.
+
+        Webcam feeds often repeat the exact same JPEG while the scene is
+        static; hashing each file's full contents finds those runs so each
+        image is decoded and encoded only once, held for the run's
+        duration. Only bytewise-identical files are merged; unreadable
+        files are kept as ordinary frames and never treated as duplicates.
+
+        Args:
+            image_files (list): Image paths in frame order
+
+        Returns:
+            list: (path, repeat_count) tuples in frame order
+        """
+        frames = []
+        last_digest = None
+        for image_path in image_files:
+            try:
+                with open(image_path, 'rb', buffering=1 << 20) as img_file:
+                    digest = hashlib.blake2b(img_file.read(), digest_size=16).digest()
+            except OSError:
+                digest = None
+            if frames and digest is not None and digest == last_digest:
+                frames[-1] = (frames[-1][0], frames[-1][1] + 1)
+            else:
+                frames.append((image_path, 1))
+                last_digest = digest
+        return frames
+
+    @staticmethod
+    def _extract_archive(tar_path: str, dest_dir: str) -> List[str]:
+        """
+        Unpack the images of one monthly tar archive.
+
+        Args:
+            tar_path (str): Path of the archive to unpack
+            dest_dir (str): Scratch directory to extract into
+
+        Returns:
+            list: Paths of the extracted images
+        """
+        extracted = []
+        try:
+            with tarfile.open(tar_path) as tar:
+                for member in tar:
+                    if not member.isfile() or not _is_timestamped_jpg(member.name):
                         continue
+                    tar.extract(member, dest_dir)
+                    extracted.append(os.path.join(dest_dir, member.name))
+        except tarfile.TarError as e:
+            print(f"Skipping unreadable archive {tar_path}: {e}")
+        return extracted
+
+    def _create_video_ffmpeg(self, frames: List[Tuple[str, int]],
+                             output_path: str) -> bool:
+        """
+        Encode the video with ffmpeg's concat demuxer.
 
-        if not image_files:
-            print("No images found for timelapse creation.")
-            return False
+        A list file hands every JPEG to one ffmpeg invocation, so no frame
+        bytes pass through Python at all and ffmpeg applies its own
+        multithreading to both decode and encode.
 
-        # Sort images by timestamp
-        image_files.sort()
+        Args:
+            frames (list): (path, repeat_count) tuples in frame order
+            output_path (str): Path where the video will be saved
+
+        Returns:
+            bool: True if video creation was successful, False otherwise
+        """
+        frame_duration = 1 / self.fps
+        list_file = tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False)
+        try:
+            with list_file:
+                for image_path, repeat_count in frames:
+                    list_file.write(f"file '{os.path.abspath(image_path)}'\n")
+                    list_file.write(f"duration {repeat_count * frame_duration}\n")
+                # The concat demuxer ignores the last entry's duration
+                # unless the final file is listed once more
+                list_file.write(f"file '{os.path.abspath(frames[-1][0])}'\n")
+
+            encoder = _detect_video_encoder()
+            command = [
+                'ffmpeg', '-y', '-f', 'concat', '-safe', '0', '-i', list_file.name,
+                '-vsync', 'vfr', '-c:v', encoder
+            ]
+            if encoder == 'libx264':
+                command += ['-preset', 'fast']
+            elif encoder == 'h264_nvenc':
+                command += ['-preset', 'p1']
+            command += [
+                '-threads', str(os.cpu_count() or 1), '-pix_fmt', 'yuv420p',
+                output_path
+            ]
+            try:
+                if subprocess.run(command).returncode != 0:
+                    print("ffmpeg failed to encode the video.")
+                    return False
+            except OSError as e:
+                print(f"Failed to encode video with ffmpeg: {e}")
+                return False
+        finally:
+            os.unlink(list_file.name)
 
+        print(f"Video saved as {output_path}")
+        return True
+
+    def _create_video_opencv(self, frames: List[Tuple[str, int]],
+                             output_path: str) -> bool:
+        """
+        Encode the video with OpenCV's VideoWriter.
+
+        Args:
+            frames (list): (path, repeat_count) tuples in frame order
+            output_path (str): Path where the video will be saved
+
+        Returns:
+            bool: True if video creation was successful, False otherwise
+        """
         # Get dimensions from first image
-        first_image = cv2.imread(image_files[0][1])
+        first_image = self._decode_frame(frames[0][0])
         if first_image is None:
             print("Failed to read the first image.")
             return False
@@ -232,13 +749,19 @@ class TimelapseCreator:
             print(f"Failed to initialize video writer: {e}")
             return False
 
-        # Add frames
-        for _, image_path in image_files:
-            frame = cv2.imread(image_path)
-            if frame is None:
-                print(f"Failed to read image: {image_path}")
-                continue
-            video.write(frame)
+        # Add frames; decode in a thread pool so the serial writer never
+        # stalls on JPEG decode (imdecode releases the GIL)
+        decode_workers = os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=decode_workers) as executor:
+            pending = deque()
+            for image_path, repeat_count in frames:
+                pending.append(
+                    (image_path, repeat_count, executor.submit(self._decode_frame, image_path))
+                )
+                if len(pending) >= 2 * decode_workers:
+                    self._write_frame(video, *pending.popleft())
+            while pending:
+                self._write_frame(video, *pending.popleft())
 
         video.release()
         print(f"Video saved as {output_path}")
@@ -257,6 +780,11 @@ class ExecutionLogger:
         """
         self.log_file = os.path.join(save_dir, 'time_log.csv')
         self.fieldnames = ['date_time', 'num_images', 'total_time', 'speed_per_image']
+        # Check once whether the header already exists instead of probing
+        # the file position on every write
+        self._has_header = (
+            os.path.exists(self.log_file) and os.path.getsize(self.log_file) > 0
+        )
 
     def log_execution(self, date_time: str, num_images: int, total_time: float) -> None:
         """
@@ -269,11 +797,12 @@ class ExecutionLogger:
         """
         speed_per_image = total_time / num_images if num_images > 0 else 0
 
-        with open(self.log_file, mode='a', newline='') as file:
+        with open(self.log_file, mode='a', newline='', buffering=1 << 16) as file:
             writer = csv.DictWriter(file, fieldnames=self.fieldnames)
 
-            if file.tell() == 0:
+            if not self._has_header:
                 writer.writeheader()
+                self._has_header = True
 
             writer.writerow({
                 'date_time': date_time,
@@ -297,6 +826,7 @@ def main():
         'max_workers': 32,
         'fps': 60,
         'exclude_night_photos': True,
+        'archive_downloads': False,
         'vid_export': True
     }
 
@@ -307,7 +837,8 @@ def main():
     downloader = ImageDownloader(
         save_dir=config['save_dir'],
         max_workers=config['max_workers'],
-        exclude_night_photos=config['exclude_night_photos']
+        exclude_night_photos=config['exclude_night_photos'],
+        archive_downloads=config['archive_downloads']
     )
     timelapse = TimelapseCreator(config['save_dir'], config['fps'])
     logger = ExecutionLogger(config['save_dir'])
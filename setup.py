@@ -9,8 +9,11 @@ setup(
     url='https://github.com/willcraig/ScrapeLapse',
     packages=find_packages(),
     install_requires=[
+        'aiohttp',
+        'aiofiles',
         'requests',
         'beautifulsoup4',
+        'lxml',
         'opencv-python',
         'python-dotenv'
     ],
@@ -24,5 +27,5 @@ setup(
         'License :: OSI Approved :: MIT License',
         'Operating System :: OS Independent',
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.9',
 )
\ No newline at end of file